@@ -1,6 +1,38 @@
+import hashlib
 import heapq
-from manim import *
-from typing import Hashable, Tuple
+import os
+import shutil
+import numpy as np
+from manim import (
+    BLACK,
+    BLUE_C,
+    DARK_GRAY,
+    DOWN,
+    GREEN,
+    LEFT,
+    LIGHT_GRAY,
+    MAROON_C,
+    MAROON_D,
+    MAROON_E,
+    PURE_RED,
+    PURPLE_C,
+    RED,
+    RED_A,
+    RED_C,
+    RIGHT,
+    UP,
+    DiGraph,
+    Dot,
+    Line,
+    Mobject,
+    MovingCameraScene,
+    SurroundingRectangle,
+    Text,
+    VGroup,
+    config,
+)
+from types import MappingProxyType
+from typing import Dict, Hashable, List, Tuple
 
 START_COLOR = GREEN
 END_COLOR = PURPLE_C
@@ -18,6 +50,8 @@ CIRCLE_COLORS = [
     MAROON_E,
 ]  # unique colors for <=6 distinct edges
 
+INF = float("inf")
+
 config.frame_size = (1000, 900)
 # config.frame_size = (500, 450)
 
@@ -46,6 +80,101 @@ START2 = 0
 END2 = 7
 
 
+DEFAULT_VERTEX_CONFIG = MappingProxyType(
+    {"radius": 0.4, "color": LIGHT_GRAY, "fill_opacity": MAIN_OPACITY}
+)
+DEFAULT_EDGE_CONFIG = MappingProxyType({"tip_length": 0.2, "color": DARK_GRAY})
+
+# directions to try, in order, when the default spot for a label is taken
+NEXT_TO_DIRS = np.array(
+    [UP, UP + RIGHT, RIGHT, DOWN + RIGHT, DOWN, DOWN + LEFT, LEFT, UP + LEFT]
+)
+
+
+def format_dist(dist: float) -> str:
+    return "∞" if dist == INF else str(dist)
+
+
+# event kinds recorded by _dijkstra_core, replayed by ShortestPath to draw each step
+POP, REACHED, VISIT, RELAX, COMPARE, DONE = range(6)
+# low bits of a packed dijkstra heap key hold the node, the rest the distance
+NODE_BITS = 32
+NODE_MASK = (1 << NODE_BITS) - 1
+
+
+def _dijkstra_core(
+    adj_offsets: np.ndarray,
+    adj_neighbors: np.ndarray,
+    adj_weights: np.ndarray,
+    start: int,
+    end: int,
+) -> Tuple[List[float], List[int], List[Tuple[int, int, int, float, float]]]:
+    """
+    Runs dijkstra's from ``start`` until ``end`` is popped, without touching any mobjects.
+    The graph is given in CSR form, see ``ShortestPath.convert_graph_to_csr``.
+
+    Returns the distances, the predecessor of each node (-1 if unreached), and an
+    event log of ``(kind, cur_node, neighbor, dist, prev_dist)`` tuples describing
+    every step of the search in order, so the animation can be replayed from it.
+    """
+    # vertices are dense ints, so plain lists index faster than dicts hash; lists
+    # (not float arrays) also keep integer distances printing as "5", not "5.0"
+    n = len(adj_offsets) - 1
+    # read the arrays back as python numbers once, scalar numpy indexing is slow
+    offsets, neighbors, weights = (
+        adj_offsets.tolist(),
+        adj_neighbors.tolist(),
+        adj_weights.tolist(),
+    )
+    distances = [INF] * n
+    distances[start] = 0
+    # with integer weights, (distance, node) packs into a single int heap key, so
+    # heapq pushes and compares plain ints instead of tuples
+    packed = adj_weights.dtype.kind in "iu"
+    pq = [start] if packed else [(0, start)]
+    prev_node = [-1] * n
+    event_log = []
+    # a node's first pop is final, any later pops of it are stale heap entries
+    visited = bytearray(n)
+
+    while len(pq) > 0:
+        if packed:
+            key = heapq.heappop(pq)
+            cur_dist, cur_node = key >> NODE_BITS, key & NODE_MASK
+        else:
+            cur_dist, cur_node = heapq.heappop(pq)
+        event_log.append((POP, cur_node, -1, cur_dist, distances[cur_node]))
+        if visited[cur_node]:
+            continue
+        visited[cur_node] = 1
+        if cur_node == end:
+            event_log.append((REACHED, cur_node, -1, cur_dist, cur_dist))
+            break
+
+        event_log.append((VISIT, cur_node, -1, cur_dist, cur_dist))
+        for i in range(offsets[cur_node], offsets[cur_node + 1]):
+            neighbor = neighbors[i]
+            distance = cur_dist + weights[i]
+            prev_neighbor_dist = distances[neighbor]
+            if distance < prev_neighbor_dist:
+                distances[neighbor] = distance
+                prev_node[neighbor] = cur_node
+                if packed:
+                    heapq.heappush(pq, (distance << NODE_BITS) | neighbor)
+                else:
+                    heapq.heappush(pq, (distance, neighbor))
+                event_log.append(
+                    (RELAX, cur_node, neighbor, distance, prev_neighbor_dist)
+                )
+            else:
+                event_log.append(
+                    (COMPARE, cur_node, neighbor, distance, prev_neighbor_dist)
+                )
+        event_log.append((DONE, cur_node, -1, cur_dist, cur_dist))
+
+    return distances, prev_node, event_log
+
+
 # manim -pql dijkstras.py
 # This file creates a sequence of pictures that show dijkstra's behavior, made for comics, without showing state vars
 class WeightedDiGraph(DiGraph):
@@ -67,28 +196,30 @@ class WeightedDiGraph(DiGraph):
         See in ``DiGraph``
     """
 
+    # flat list of the non-VGroup mobjects in this graph, built on first use and
+    # then kept up to date as mobjects are added, removed or swapped in
+    _tracked_leaves: list[Mobject] | None = None
+    # unpositioned Text mobjects shared by all graphs, keyed by their arguments
+    _text_cache: dict[tuple, Text] = {}
+    _text_pair_cache: dict[tuple, VGroup] = {}
+
     def __init__(
         self,
         vertex_values: list[Hashable],
         weighted_edges: list[tuple[Hashable, Hashable, Hashable]],
         *args,
-        vertex_config={},
-        edge_config={},
+        vertex_config=None,
+        edge_config=None,
         start=None,
         end=None,
         **kwargs,
     ):
-        vertex_radius = 0.4
+        # DiGraph applies non-vertex / non-edge keys to every vertex / edge, so one
+        # shared default is enough; it gets a fresh dict since DiGraph pops from it
         if not vertex_config:
-            for v in vertex_values:
-                vertex_config[v] = {
-                    "radius": vertex_radius,
-                    "color": LIGHT_GRAY,
-                    "fill_opacity": MAIN_OPACITY,
-                }
+            vertex_config = dict(DEFAULT_VERTEX_CONFIG)
         if not edge_config:
-            for v1, v2, _ in weighted_edges:
-                edge_config[(v1, v2)] = {"tip_length": 0.2, "color": DARK_GRAY}
+            edge_config = dict(DEFAULT_EDGE_CONFIG)
 
         edge_pairs = [(v1, v2) for v1, v2, _ in weighted_edges]
         super().__init__(
@@ -108,10 +239,13 @@ class WeightedDiGraph(DiGraph):
             **kwargs,
         )
 
+        # edge mobjects and weights as parallel arrays, each edge looked up once
+        self._edge_weights = np.asarray([w for _, _, w in weighted_edges])
+        self._edge_objs = [self.edges[e] for e in edge_pairs]
+
         self.label_font_size = 24
         self.label_setup(
             vertex_values,
-            weighted_edges,
             start,
             end,
         )
@@ -119,7 +253,6 @@ class WeightedDiGraph(DiGraph):
     def label_setup(
         self,
         vertices: list[Hashable],
-        weighted_edges: list[tuple[Hashable, Hashable, Hashable]],
         start: Hashable | None,
         end: Hashable | None,
     ):
@@ -130,7 +263,7 @@ class WeightedDiGraph(DiGraph):
             self.annotate_vertex(end, "goal")
             self.vertices[end].set(color=PURPLE_C, fill_opacity=MAIN_OPACITY)
 
-        self.edge_labels = self.init_edge_labels(weighted_edges)
+        self.edge_labels = self.init_edge_labels()
         self.add(self.edge_labels)
 
         self.node_labels = self.init_node_labels(vertices)
@@ -139,13 +272,19 @@ class WeightedDiGraph(DiGraph):
         self.dist_labels = self.init_dist_labels()
         self.add(self.dist_labels)
 
-    def init_edge_labels(self, weighted_edges):
+        # the layout is fixed from here on, so pick each distance label's side once
+        # against the full label set and reuse it for every later update
+        self.label_dirs = {
+            v: self.no_overlap_next_to(dist_label, dot, LEFT)
+            for (v, dot), dist_label in zip(self.vertices.items(), self.dist_labels)
+        }
+
+    def init_edge_labels(self):
         alpha = 0.5
         edge_labels = VGroup()
-        for v1, v2, weight in weighted_edges:
-            edge_obj = self.edges[(v1, v2)]
+        for edge_obj, weight in zip(self._edge_objs, self._edge_weights):
             point = edge_obj.point_from_proportion(alpha)
-            label = Text(str(weight), font_size=24, color=LIGHT_GRAY).move_to(point)
+            label = self.make_text(str(weight), 24, color=LIGHT_GRAY).move_to(point)
             label.add_background_rectangle(
                 color=config.background_color, opacity=1.0, buff=0.05
             )
@@ -156,7 +295,7 @@ class WeightedDiGraph(DiGraph):
         node_labels = VGroup()
         for v in vertices:
             v_obj = self.vertices[v]
-            label = Text(str(v), font_size=30, color=BLACK)
+            label = self.make_text(str(v), 30, color=BLACK)
             label.move_to(v_obj.get_center())
             node_labels.add(label)
         return node_labels
@@ -164,15 +303,40 @@ class WeightedDiGraph(DiGraph):
     def init_dist_labels(self, value="∞", color=BEST_SO_FAR_COLOR):
         dist_labels = VGroup()
         for _, dot in self.vertices.items():
-            dist_label = Text(
-                str(value), font_size=self.label_font_size, color=BEST_SO_FAR_COLOR
+            dist_label = self.make_text(
+                str(value), self.label_font_size, color=BEST_SO_FAR_COLOR
             )
-            self.no_overlap_next_to(dist_label, dot, LEFT)
+            # provisional spot; label_setup picks the final side once every
+            # label exists
+            dist_label.next_to(dot, LEFT, buff=0.1)
             dist_labels.add(dist_label)
         return dist_labels
 
+    def make_text(self, text: str, font_size: float, color=None, **kwargs) -> Text:
+        # building a Text goes through the whole font/svg pipeline, so build each
+        # distinct label once and hand out copies of it
+        key = (text, font_size, str(color), tuple(sorted(kwargs.items())))
+        if key not in self._text_cache:
+            self._text_cache[key] = Text(
+                text, font_size=font_size, color=color, **kwargs
+            )
+        return self._text_cache[key].copy()
+
+    def make_text_pair(self, new: str, old: str) -> VGroup:
+        # the same "new  old" distance comparisons come up again and again, so
+        # lay each pair out once too
+        key = (new, old, self.label_font_size)
+        if key not in self._text_pair_cache:
+            new_text = self.make_text(new, self.label_font_size, color=FOCUS_COLOR)
+            old_text = self.make_text(
+                old, self.label_font_size, color=BEST_SO_FAR_COLOR
+            )
+            new_text.next_to(old_text, LEFT, buff=0.2)
+            self._text_pair_cache[key] = VGroup(new_text, old_text)
+        return self._text_pair_cache[key].copy()
+
     def annotate_vertex(self, node, text):
-        text_obj = Text(text, font_size=self.label_font_size)
+        text_obj = self.make_text(text, self.label_font_size)
         self.no_overlap_next_to(text_obj, self.vertices[node], LEFT)
         self.add(text_obj)
         return text_obj
@@ -180,75 +344,108 @@ class WeightedDiGraph(DiGraph):
     def no_overlap_next_to(
         self, insert_obj: Mobject, target_obj: Mobject, default_dir=LEFT, buff=0.1
     ):
-        dirs = [UP, UP + RIGHT, RIGHT, DOWN + RIGHT, DOWN, DOWN + LEFT, LEFT, UP + LEFT]
-        dirs = [default_dir] + dirs
-
-        def is_overlapping(obj1: Mobject, obj2: Mobject):
-            obj1_left, obj1_right = obj1.get_left()[0], obj1.get_right()[0]
-            obj1_bottom, obj1_top = obj1.get_bottom()[1], obj1.get_top()[1]
-
-            obj2_left, obj2_right = obj2.get_left()[0], obj2.get_right()[0]
-            obj2_bottom, obj2_top = obj2.get_bottom()[1], obj2.get_top()[1]
-
-            horizontal_overlap = not (obj1_right < obj2_left or obj1_left > obj2_right)
-            vertical_overlap = not (obj1_top < obj2_bottom or obj1_bottom > obj2_top)
-
-            return horizontal_overlap and vertical_overlap
-
-        for dir in dirs:
-            insert_obj.next_to(target_obj, dir, buff=buff)
-            overlapping = False
-            for obj in self.get_tracked_mobjects():
-                if (
-                    obj is not insert_obj
-                    and obj is not target_obj
-                    and is_overlapping(insert_obj, obj)
-                ):
-                    overlapping = True
-                    break
-            if not overlapping:
-                return
+        dirs = np.vstack([default_dir, NEXT_TO_DIRS])
+
+        # bounding boxes of everything already placed, as (N, 2) lower-left and
+        # upper-right corners, so each candidate spot is tested in one pass
+        tracked = [
+            obj
+            for obj in self.get_tracked_mobjects()
+            if obj is not insert_obj and obj is not target_obj
+        ]
+        mins = np.array([obj.get_corner(DOWN + LEFT)[:2] for obj in tracked])
+        maxs = np.array([obj.get_corner(UP + RIGHT)[:2] for obj in tracked])
+        mins, maxs = mins.reshape(-1, 2), maxs.reshape(-1, 2)
+
+        # where insert_obj's box would land for each direction, following next_to
+        target_min = target_obj.get_corner(DOWN + LEFT)[:2]
+        target_max = target_obj.get_corner(UP + RIGHT)[:2]
+        insert_min = insert_obj.get_corner(DOWN + LEFT)[:2]
+        insert_max = insert_obj.get_corner(UP + RIGHT)[:2]
+        insert_half = (insert_max - insert_min) / 2
+        centers = (
+            (target_min + target_max) / 2
+            + np.sign(dirs[:, :2]) * ((target_max - target_min) / 2 + insert_half)
+            + buff * dirs[:, :2]
+        )
+        cand_mins, cand_maxs = centers - insert_half, centers + insert_half
 
-    def get_tracked_mobjects(self) -> List[Mobject]:
-        tracked_mobjects = []
+        # (dirs, N) grid of which candidate overlaps which tracked mobject
+        overlaps = np.all(
+            (mins[None] <= cand_maxs[:, None]) & (maxs[None] >= cand_mins[:, None]),
+            axis=2,
+        )
+        free = ~overlaps.any(axis=1)
+        # if every spot is taken, settle for the last direction tried
+        best = np.argmax(free) if free.any() else len(dirs) - 1
+        insert_obj.next_to(target_obj, dirs[best], buff=buff)
+        return dirs[best]
 
-        def recurse_mobjects(mobject):
-            if isinstance(mobject, VGroup):
-                for submobj in mobject.submobjects:
-                    recurse_mobjects(submobj)
+    def get_tracked_mobjects(self) -> List[Mobject]:
+        if self._tracked_leaves is None:
+            tracked_mobjects = []
+            for mobj in self.submobjects:
+                tracked_mobjects.extend(WeightedDiGraph.get_leaves(mobj))
+            self._tracked_leaves = tracked_mobjects
+        return self._tracked_leaves
+
+    @staticmethod
+    def get_leaves(mobject: Mobject) -> List[Mobject]:
+        leaves = []
+        stack = [mobject]
+        while stack:
+            mobj = stack.pop()
+            if isinstance(mobj, VGroup):
+                stack.extend(reversed(mobj.submobjects))
             else:
-                tracked_mobjects.append(mobject)
-
-        for mobj in self.submobjects:
-            recurse_mobjects(mobj)
-
-        return tracked_mobjects
+                leaves.append(mobj)
+        return leaves
+
+    def untrack(self, *mobjects: Mobject):
+        if self._tracked_leaves is None:
+            return
+        removed = {id(leaf) for m in mobjects for leaf in WeightedDiGraph.get_leaves(m)}
+        self._tracked_leaves = [
+            leaf for leaf in self._tracked_leaves if id(leaf) not in removed
+        ]
+
+    def track(self, *mobjects: Mobject):
+        if self._tracked_leaves is None:
+            return
+        for m in mobjects:
+            self._tracked_leaves.extend(WeightedDiGraph.get_leaves(m))
+
+    def add(self, *mobjects: Mobject):
+        new_mobjects = [m for m in mobjects if m not in self.submobjects]
+        super().add(*mobjects)
+        self.track(*new_mobjects)
+        return self
+
+    def remove(self, *mobjects: Mobject):
+        self.untrack(*[m for m in mobjects if m in self.submobjects])
+        return super().remove(*mobjects)
+
+    def set_dist_label(self, node, dist_label: Mobject):
+        self.untrack(self.dist_labels[node])
+        self.dist_labels[node] = dist_label
+        self.track(dist_label)
 
     def show_dist_label(self, node, distance, color=MIN_DIST_COLOR):
-        text = "∞" if distance == float("inf") else str(distance)
-        dist_label = Text(
-            text,
-            font_size=self.label_font_size,
+        dist_label = self.make_text(
+            format_dist(distance),
+            self.label_font_size,
             color=color,
             fill_opacity=0.5,
         )
-        self.no_overlap_next_to(dist_label, self.vertices[node], LEFT)
-        self.dist_labels[node] = dist_label
+        dist_label.next_to(self.vertices[node], self.label_dirs[node], buff=0.1)
+        self.set_dist_label(node, dist_label)
 
     def update_dist_label(self, node, dist, prev_dist, color=RED):
         z_index_below, z_index_above = 20, 21
-        dist_text = "∞" if dist == float("inf") else str(dist)
-        prev_dist_text = "∞" if prev_dist == float("inf") else str(prev_dist)
-        new_text = Text(
-            dist_text + "  ", color=FOCUS_COLOR, font_size=self.label_font_size
-        )
-        old_text = Text(
-            prev_dist_text, color=BEST_SO_FAR_COLOR, font_size=self.label_font_size
-        )
-        new_text.next_to(old_text, LEFT, buff=0.2)
-
-        text = VGroup(new_text, old_text).set_z_index(z_index_above)
-        self.no_overlap_next_to(text, self.vertices[node], LEFT)
+        text = self.make_text_pair(format_dist(dist) + "  ", format_dist(prev_dist))
+        text.set_z_index(z_index_above)
+        old_text = text[1]
+        text.next_to(self.vertices[node], self.label_dirs[node], buff=0.1)
 
         box = SurroundingRectangle(
             text,
@@ -266,30 +463,20 @@ class WeightedDiGraph(DiGraph):
         cross_line.move_to(old_text.get_center())
 
         dist_update_unit = VGroup(text, cross_line, box)
-        self.dist_labels[node] = dist_update_unit
+        self.set_dist_label(node, dist_update_unit)
 
     def compare_dist_label(
         self, node, dist, prev_dist, color=FOCUS_COLOR, opacity=MAIN_OPACITY
     ):
-        dist_text = "∞" if dist == float("inf") else str(dist)
-        prev_dist_text = "∞" if prev_dist == float("inf") else str(prev_dist)
-        new_text = Text(
-            dist_text + " ≥ ", color=FOCUS_COLOR, font_size=self.label_font_size
-        )
-        old_text = Text(
-            prev_dist_text, color=BEST_SO_FAR_COLOR, font_size=self.label_font_size
-        )
-        new_text.next_to(old_text, LEFT, buff=0.2)
-
-        text = VGroup(new_text, old_text)
-        self.no_overlap_next_to(text, self.vertices[node], LEFT)
+        text = self.make_text_pair(format_dist(dist) + " ≥ ", format_dist(prev_dist))
+        text.next_to(self.vertices[node], self.label_dirs[node], buff=0.1)
 
         box = SurroundingRectangle(
             text, color=color, buff=0.1, corner_radius=0.1, stroke_opacity=opacity
         )
 
         dist_update_unit = VGroup(text, box)
-        self.dist_labels[node] = dist_update_unit
+        self.set_dist_label(node, dist_update_unit)
 
     def highlight_node(
         self,
@@ -304,17 +491,53 @@ class WeightedDiGraph(DiGraph):
         edge = self.edges[(start, end)]
         edge.set_color(color).set_opacity(opacity)
 
+    def batch_apply(self, neighbor_updates):
+        """
+        Applies a step's ``show_dist_label`` and ``highlight_edge`` calls in one
+        pass, given as one ``(dist_args, edge_args)`` pair of argument tuples per
+        neighbor.
+        """
+        for dist_args, edge_args in neighbor_updates:
+            self.show_dist_label(*dist_args)
+            self.highlight_edge(*edge_args)
+
 
 class ShortestPath(MovingCameraScene):
     def __init__(self, file_suffix=0):
         super().__init__()
         self.cur_frame = 0
         self.file_suffix = file_suffix
+        # frame fingerprint -> path of the png already saved for that frame
+        self._frame_paths: dict[bytes, str] = {}
 
     # unique suffix for creating different folders for different runs
     def set_file_suffix(self, file_suffix):
         self.file_suffix = file_suffix
 
+    @staticmethod
+    def convert_graph_to_csr(
+        graph: Dict[int, List[Tuple[int, int]]],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Packs a ``{vertex: [(neighbor, weight), ...]}`` graph with vertices
+        ``0..n-1`` into CSR arrays: the edges out of ``v`` are the entries
+        ``offsets[v]:offsets[v + 1]`` of ``neighbors`` and ``weights``.
+        """
+        n = len(graph)
+        degrees = np.fromiter(
+            (len(graph[v]) for v in range(n)), dtype=np.int64, count=n
+        )
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+        neighbors = np.fromiter(
+            (u for v in range(n) for u, _ in graph[v]),
+            dtype=np.int64,
+            count=offsets[-1],
+        )
+        # keep the weights' own dtype so integer distances stay integers
+        weights = np.array([w for v in range(n) for _, w in graph[v]])
+        return offsets, neighbors, weights
+
     def convert_graph_to_digraph_format(graph):
         vertices = list(graph.keys())
         edges = []
@@ -327,8 +550,25 @@ class ShortestPath(MovingCameraScene):
         # self.file_suffix not used atm
         self.renderer.camera.capture_mobjects(self.mobjects)
         pixel_array = self.renderer.camera.pixel_array
-        img = self.renderer.camera.get_image(pixel_array).copy()
-        img.save(f"./media/dijkstra-steps/step{self.cur_frame}.png")
+        path = f"./media/dijkstra-steps/step{self.cur_frame}.png"
+        # a leftover file may be a hard link from an earlier run, so never write
+        # through it
+        if os.path.exists(path):
+            os.remove(path)
+        # consecutive steps often render the same frame, so link to the png that
+        # was already encoded for it instead of encoding it again
+        frame_hash = hashlib.blake2b(pixel_array.tobytes(), digest_size=8).digest()
+        if frame_hash in self._frame_paths:
+            try:
+                os.link(self._frame_paths[frame_hash], path)
+            except OSError:
+                shutil.copyfile(self._frame_paths[frame_hash], path)
+        else:
+            # the image is a view on pixel_array and save only reads it, so no copy;
+            # a light zlib level encodes much faster for a slightly larger png
+            img = self.renderer.camera.get_image(pixel_array)
+            img.save(path, compress_level=1)
+            self._frame_paths[frame_hash] = path
         self.renderer.camera.reset()
         self.cur_frame += 1
 
@@ -341,11 +581,9 @@ class ShortestPath(MovingCameraScene):
             start: int,
             end: int,
         ) -> Tuple[float, List[int]]:
-            distances = {node: float("inf") for node in graph}
-            distances[start] = 0
-            pq = [(0, start)]
-            prev_node = {}
-            reached = False
+            distances, prev_node, event_log = _dijkstra_core(
+                *ShortestPath.convert_graph_to_csr(graph), start, end
+            )
 
             new_pos = vgraph.get_center()
             self.camera.frame.shift(new_pos)
@@ -354,53 +592,49 @@ class ShortestPath(MovingCameraScene):
                 width=vgraph.width * scalar, height=vgraph.height * scalar
             )
             self.capture()
-            while len(pq) > 0:
-                cur_dist, cur_node = heapq.heappop(pq)
-                # step 1: show node being processed
-                vgraph.show_dist_label(cur_node, cur_dist)
-                vgraph.highlight_node(cur_node, color=FOCUS_COLOR, opacity=1.0)
-
-                if cur_dist > distances[cur_node]:
-                    continue
-                if cur_node == end:
-                    reached = True
+            # replay the recorded search, drawing each step
+            _neighbor_updates = []
+            circle_colors = iter(CIRCLE_COLORS)
+            for kind, cur_node, neighbor, dist, prev_dist in event_log:
+                if kind == POP:
+                    # step 1: show node being processed
+                    vgraph.show_dist_label(cur_node, dist)
+                    vgraph.highlight_node(cur_node, color=FOCUS_COLOR, opacity=1.0)
+                elif kind == REACHED:
                     self.capture()
                     vgraph.highlight_node(cur_node)
-                    break
-
-                self.capture()
-                # step 2: show relaxation of edges
-                _dist_label_args_lst = []
-                _highlight_edge_args_lst = []
-                circle_colors = iter(CIRCLE_COLORS)
-                for neighbor, weight in graph[cur_node]:
-                    distance = cur_dist + weight
-                    prev_neighbor_dist = distances[neighbor]  # used for tracking
-                    if distance < distances[neighbor]:
-                        distances[neighbor] = distance
-                        prev_node[neighbor] = cur_node
-                        heapq.heappush(pq, (distance, neighbor))
-                        vgraph.highlight_edge(cur_node, neighbor, opacity=1.0)
-                        vgraph.update_dist_label(
-                            neighbor, distance, prev_neighbor_dist, next(circle_colors)
+                elif kind == VISIT:
+                    self.capture()
+                    _neighbor_updates = []
+                    circle_colors = iter(CIRCLE_COLORS)
+                elif kind == RELAX:
+                    # step 2: show relaxation of edges
+                    vgraph.highlight_edge(cur_node, neighbor, opacity=1.0)
+                    vgraph.update_dist_label(
+                        neighbor, dist, prev_dist, next(circle_colors)
+                    )
+                    _neighbor_updates.append(
+                        (
+                            (neighbor, dist, BEST_SO_FAR_COLOR),
+                            (cur_node, neighbor, GREEN),
                         )
-                    else:
-                        vgraph.highlight_edge(cur_node, neighbor)
-                        vgraph.compare_dist_label(
-                            neighbor, distance, prev_neighbor_dist
+                    )
+                elif kind == COMPARE:
+                    vgraph.highlight_edge(cur_node, neighbor)
+                    vgraph.compare_dist_label(neighbor, dist, prev_dist)
+                    _neighbor_updates.append(
+                        (
+                            (neighbor, dist, BEST_SO_FAR_COLOR),
+                            (cur_node, neighbor, GREEN),
                         )
+                    )
+                elif kind == DONE:
+                    self.capture()
+                    # Cleanup
+                    vgraph.highlight_node(cur_node)
+                    vgraph.batch_apply(_neighbor_updates)
 
-                    _highlight_edge_args_lst.append((cur_node, neighbor, GREEN))
-                    _dist_label_args_lst.append((neighbor, distance, BEST_SO_FAR_COLOR))
-                self.capture()
-                # Cleanup
-                vgraph.highlight_node(cur_node)
-                for args in _dist_label_args_lst:
-                    vgraph.show_dist_label(*args)
-                for args in _highlight_edge_args_lst:
-                    vgraph.highlight_edge(*args)
-
-            if reached:
+            if distances[end] != INF:
                 path = []
                 node = end
                 while node != start:
@@ -417,7 +651,7 @@ class ShortestPath(MovingCameraScene):
                 vgraph.highlight_node(node, color=FOCUS_COLOR, opacity=1.0)
                 self.capture()
                 return distances[end], path
-            return float("inf"), []
+            return INF, []
 
         file_suffix = 1
         graph, start, end = GRAPH1, START1, END1
@@ -1,4 +1,4 @@
-from manim import *
+from manim import RED, Scene, Square
 
 
 class SquareDemo(Scene):
@@ -14,51 +14,324 @@ from .utils.commands import *
 
 # isort: on
 
-from .camera.camera import *
-from .camera.mapping_camera import *
-from .camera.moving_camera import *
-from .camera.multi_camera import *
 from .constants import *
-from .mobject.frame import *
-from .mobject.geometry.arc import *
-from .mobject.geometry.labeled import *
-from .mobject.geometry.line import *
-from .mobject.geometry.polygram import *
-from .mobject.geometry.shape_matchers import *
-from .mobject.geometry.tips import *
-from .mobject.graph import *
-from .mobject.graphing.coordinate_systems import *
-from .mobject.graphing.functions import *
-from .mobject.graphing.number_line import *
-from .mobject.graphing.probability import *
-from .mobject.graphing.scale import *
-from .mobject.matrix import *
-from .mobject.mobject import *
-from .mobject.svg.brace import *
-from .mobject.svg.svg_mobject import *
-from .mobject.table import *
-from .mobject.text.code_mobject import *
-from .mobject.text.numbers import *
-from .mobject.text.tex_mobject import *
-from .mobject.text.text_mobject import *
-from .mobject.types.image_mobject import *
-from .mobject.types.point_cloud_mobject import *
-from .mobject.types.vectorized_mobject import *
-from .mobject.value_tracker import *
-from .mobject.vector_field import *
-from .renderer.web_renderer import *
-from .scene.moving_camera_scene import *
-from .scene.scene import *
-from .scene.section import *
-from .utils.bezier import *
 from .utils.color import *
-from .utils.config_ops import *
-from .utils.debug import *
-from .utils.images import *
-from .utils.iterables import *
-from .utils.paths import *
-from .utils.rate_functions import *
-from .utils.simple_functions import *
-from .utils.space_ops import *
-from .utils.tex import *
-from .utils.tex_templates import *
+
+# Everything else is only imported the first time one of its names is looked up
+# (PEP 562), so a scene only pays for the parts of manim it actually uses. This
+# table must list every name in these modules' __all__; ``from manim import *``
+# checks that it does.
+_LAZY = {
+    # .camera.camera
+    "Camera": ".camera.camera",
+    "BackgroundColoredVMobjectDisplayer": ".camera.camera",
+    # .camera.mapping_camera
+    "MappingCamera": ".camera.mapping_camera",
+    "OldMultiCamera": ".camera.mapping_camera",
+    "SplitScreenCamera": ".camera.mapping_camera",
+    # .camera.moving_camera
+    "MovingCamera": ".camera.moving_camera",
+    # .camera.multi_camera
+    "MultiCamera": ".camera.multi_camera",
+    # .mobject.frame
+    "ScreenRectangle": ".mobject.frame",
+    "FullScreenRectangle": ".mobject.frame",
+    # .mobject.geometry.arc
+    "TipableVMobject": ".mobject.geometry.arc",
+    "Arc": ".mobject.geometry.arc",
+    "ArcBetweenPoints": ".mobject.geometry.arc",
+    "CurvedArrow": ".mobject.geometry.arc",
+    "CurvedDoubleArrow": ".mobject.geometry.arc",
+    "Circle": ".mobject.geometry.arc",
+    "Dot": ".mobject.geometry.arc",
+    "AnnotationDot": ".mobject.geometry.arc",
+    "LabeledDot": ".mobject.geometry.arc",
+    "Ellipse": ".mobject.geometry.arc",
+    "AnnularSector": ".mobject.geometry.arc",
+    "Sector": ".mobject.geometry.arc",
+    "Annulus": ".mobject.geometry.arc",
+    "CubicBezier": ".mobject.geometry.arc",
+    "ArcPolygon": ".mobject.geometry.arc",
+    "ArcPolygonFromArcs": ".mobject.geometry.arc",
+    # .mobject.geometry.labeled
+    "LabeledLine": ".mobject.geometry.labeled",
+    "LabeledArrow": ".mobject.geometry.labeled",
+    # .mobject.geometry.line
+    "Line": ".mobject.geometry.line",
+    "DashedLine": ".mobject.geometry.line",
+    "TangentLine": ".mobject.geometry.line",
+    "Elbow": ".mobject.geometry.line",
+    "Arrow": ".mobject.geometry.line",
+    "Vector": ".mobject.geometry.line",
+    "DoubleArrow": ".mobject.geometry.line",
+    "Angle": ".mobject.geometry.line",
+    "RightAngle": ".mobject.geometry.line",
+    # .mobject.geometry.polygram
+    "Polygram": ".mobject.geometry.polygram",
+    "Polygon": ".mobject.geometry.polygram",
+    "RegularPolygram": ".mobject.geometry.polygram",
+    "RegularPolygon": ".mobject.geometry.polygram",
+    "Star": ".mobject.geometry.polygram",
+    "Triangle": ".mobject.geometry.polygram",
+    "Rectangle": ".mobject.geometry.polygram",
+    "Square": ".mobject.geometry.polygram",
+    "RoundedRectangle": ".mobject.geometry.polygram",
+    "Cutout": ".mobject.geometry.polygram",
+    # .mobject.geometry.shape_matchers
+    "SurroundingRectangle": ".mobject.geometry.shape_matchers",
+    "BackgroundRectangle": ".mobject.geometry.shape_matchers",
+    "Cross": ".mobject.geometry.shape_matchers",
+    "Underline": ".mobject.geometry.shape_matchers",
+    # .mobject.geometry.tips
+    "ArrowTip": ".mobject.geometry.tips",
+    "ArrowCircleFilledTip": ".mobject.geometry.tips",
+    "ArrowCircleTip": ".mobject.geometry.tips",
+    "ArrowSquareTip": ".mobject.geometry.tips",
+    "ArrowSquareFilledTip": ".mobject.geometry.tips",
+    "ArrowTriangleTip": ".mobject.geometry.tips",
+    "ArrowTriangleFilledTip": ".mobject.geometry.tips",
+    "StealthTip": ".mobject.geometry.tips",
+    # .mobject.graph
+    "Graph": ".mobject.graph",
+    "DiGraph": ".mobject.graph",
+    # .mobject.graphing.coordinate_systems
+    "CoordinateSystem": ".mobject.graphing.coordinate_systems",
+    "Axes": ".mobject.graphing.coordinate_systems",
+    "ThreeDAxes": ".mobject.graphing.coordinate_systems",
+    "NumberPlane": ".mobject.graphing.coordinate_systems",
+    "PolarPlane": ".mobject.graphing.coordinate_systems",
+    "ComplexPlane": ".mobject.graphing.coordinate_systems",
+    # .mobject.graphing.functions
+    "ParametricFunction": ".mobject.graphing.functions",
+    "FunctionGraph": ".mobject.graphing.functions",
+    "ImplicitFunction": ".mobject.graphing.functions",
+    # .mobject.graphing.number_line
+    "NumberLine": ".mobject.graphing.number_line",
+    "UnitInterval": ".mobject.graphing.number_line",
+    # .mobject.graphing.probability
+    "SampleSpace": ".mobject.graphing.probability",
+    "BarChart": ".mobject.graphing.probability",
+    # .mobject.graphing.scale
+    "LogBase": ".mobject.graphing.scale",
+    "LinearBase": ".mobject.graphing.scale",
+    # .mobject.matrix
+    "Matrix": ".mobject.matrix",
+    "DecimalMatrix": ".mobject.matrix",
+    "IntegerMatrix": ".mobject.matrix",
+    "MobjectMatrix": ".mobject.matrix",
+    "matrix_to_tex_string": ".mobject.matrix",
+    "matrix_to_mobject": ".mobject.matrix",
+    "get_det_text": ".mobject.matrix",
+    # .mobject.mobject
+    "Mobject": ".mobject.mobject",
+    "Group": ".mobject.mobject",
+    # .mobject.svg.brace
+    "Brace": ".mobject.svg.brace",
+    "BraceBetweenPoints": ".mobject.svg.brace",
+    "BraceLabel": ".mobject.svg.brace",
+    "ArcBrace": ".mobject.svg.brace",
+    # .mobject.svg.svg_mobject
+    "SVGMobject": ".mobject.svg.svg_mobject",
+    "VMobjectFromSVGPath": ".mobject.svg.svg_mobject",
+    # .mobject.table
+    "Table": ".mobject.table",
+    "MathTable": ".mobject.table",
+    "MobjectTable": ".mobject.table",
+    "IntegerTable": ".mobject.table",
+    "DecimalTable": ".mobject.table",
+    # .mobject.text.code_mobject
+    "Code": ".mobject.text.code_mobject",
+    # .mobject.text.numbers
+    "DecimalNumber": ".mobject.text.numbers",
+    "Integer": ".mobject.text.numbers",
+    "Variable": ".mobject.text.numbers",
+    # .mobject.text.tex_mobject
+    "SingleStringMathTex": ".mobject.text.tex_mobject",
+    "MathTex": ".mobject.text.tex_mobject",
+    "Tex": ".mobject.text.tex_mobject",
+    "BulletedList": ".mobject.text.tex_mobject",
+    "Title": ".mobject.text.tex_mobject",
+    # .mobject.text.text_mobject
+    "Text": ".mobject.text.text_mobject",
+    "Paragraph": ".mobject.text.text_mobject",
+    "MarkupText": ".mobject.text.text_mobject",
+    # .mobject.types.image_mobject
+    "ImageMobject": ".mobject.types.image_mobject",
+    "ImageMobjectFromCamera": ".mobject.types.image_mobject",
+    # .mobject.types.point_cloud_mobject
+    "PMobject": ".mobject.types.point_cloud_mobject",
+    "Mobject1D": ".mobject.types.point_cloud_mobject",
+    "Mobject2D": ".mobject.types.point_cloud_mobject",
+    "PGroup": ".mobject.types.point_cloud_mobject",
+    "PointCloudDot": ".mobject.types.point_cloud_mobject",
+    "Point": ".mobject.types.point_cloud_mobject",
+    # .mobject.types.vectorized_mobject
+    "VMobject": ".mobject.types.vectorized_mobject",
+    "VGroup": ".mobject.types.vectorized_mobject",
+    "VDict": ".mobject.types.vectorized_mobject",
+    "VectorizedPoint": ".mobject.types.vectorized_mobject",
+    "CurvesAsSubmobjects": ".mobject.types.vectorized_mobject",
+    "DashedVMobject": ".mobject.types.vectorized_mobject",
+    # .mobject.value_tracker
+    "ValueTracker": ".mobject.value_tracker",
+    "ComplexValueTracker": ".mobject.value_tracker",
+    # .mobject.vector_field
+    "VectorField": ".mobject.vector_field",
+    "ArrowVectorField": ".mobject.vector_field",
+    "StreamLines": ".mobject.vector_field",
+    # .renderer.web_renderer
+    "WebRenderer": ".renderer.web_renderer",
+    # .scene.moving_camera_scene
+    "MovingCameraScene": ".scene.moving_camera_scene",
+    # .scene.scene
+    "Scene": ".scene.scene",
+    # .scene.section
+    "Section": ".scene.section",
+    "DefaultSectionType": ".scene.section",
+    # .utils.bezier
+    "bezier": ".utils.bezier",
+    "partial_bezier_points": ".utils.bezier",
+    "partial_quadratic_bezier_points": ".utils.bezier",
+    "interpolate": ".utils.bezier",
+    "integer_interpolate": ".utils.bezier",
+    "mid": ".utils.bezier",
+    "inverse_interpolate": ".utils.bezier",
+    "match_interpolate": ".utils.bezier",
+    "get_smooth_handle_points": ".utils.bezier",
+    "get_smooth_cubic_bezier_handle_points": ".utils.bezier",
+    "diag_to_matrix": ".utils.bezier",
+    "is_closed": ".utils.bezier",
+    "proportions_along_bezier_curve_for_point": ".utils.bezier",
+    "point_lies_on_bezier": ".utils.bezier",
+    # .utils.config_ops
+    "merge_dicts_recursively": ".utils.config_ops",
+    "update_dict_recursively": ".utils.config_ops",
+    "DictAsObject": ".utils.config_ops",
+    # .utils.debug
+    "print_family": ".utils.debug",
+    "index_labels": ".utils.debug",
+    # .utils.images
+    "get_full_raster_image_path": ".utils.images",
+    "drag_pixels": ".utils.images",
+    "invert_image": ".utils.images",
+    "change_to_rgba_array": ".utils.images",
+    # .utils.iterables
+    "adjacent_n_tuples": ".utils.iterables",
+    "adjacent_pairs": ".utils.iterables",
+    "all_elements_are_instances": ".utils.iterables",
+    "concatenate_lists": ".utils.iterables",
+    "list_difference_update": ".utils.iterables",
+    "list_difference_update_by_id": ".utils.iterables",
+    "list_update": ".utils.iterables",
+    "list_update_by_id": ".utils.iterables",
+    "listify": ".utils.iterables",
+    "make_even": ".utils.iterables",
+    "make_even_by_cycling": ".utils.iterables",
+    "remove_list_redundancies": ".utils.iterables",
+    "remove_nones": ".utils.iterables",
+    "stretch_array_to_length": ".utils.iterables",
+    "tuplify": ".utils.iterables",
+    # .utils.paths
+    "straight_path": ".utils.paths",
+    "path_along_arc": ".utils.paths",
+    "clockwise_path": ".utils.paths",
+    "counterclockwise_path": ".utils.paths",
+    # .utils.rate_functions
+    "linear": ".utils.rate_functions",
+    "smooth": ".utils.rate_functions",
+    "smoothstep": ".utils.rate_functions",
+    "smootherstep": ".utils.rate_functions",
+    "smoothererstep": ".utils.rate_functions",
+    "rush_into": ".utils.rate_functions",
+    "rush_from": ".utils.rate_functions",
+    "slow_into": ".utils.rate_functions",
+    "double_smooth": ".utils.rate_functions",
+    "there_and_back": ".utils.rate_functions",
+    "there_and_back_with_pause": ".utils.rate_functions",
+    "running_start": ".utils.rate_functions",
+    "not_quite_there": ".utils.rate_functions",
+    "wiggle": ".utils.rate_functions",
+    "squish_rate_func": ".utils.rate_functions",
+    "lingering": ".utils.rate_functions",
+    "exponential_decay": ".utils.rate_functions",
+    # .utils.simple_functions
+    "binary_search": ".utils.simple_functions",
+    "choose": ".utils.simple_functions",
+    "clip": ".utils.simple_functions",
+    "sigmoid": ".utils.simple_functions",
+    # .utils.space_ops
+    "quaternion_mult": ".utils.space_ops",
+    "quaternion_from_angle_axis": ".utils.space_ops",
+    "angle_axis_from_quaternion": ".utils.space_ops",
+    "quaternion_conjugate": ".utils.space_ops",
+    "rotate_vector": ".utils.space_ops",
+    "thick_diagonal": ".utils.space_ops",
+    "rotation_matrix": ".utils.space_ops",
+    "rotation_about_z": ".utils.space_ops",
+    "z_to_vector": ".utils.space_ops",
+    "angle_of_vector": ".utils.space_ops",
+    "angle_between_vectors": ".utils.space_ops",
+    "normalize": ".utils.space_ops",
+    "get_unit_normal": ".utils.space_ops",
+    "compass_directions": ".utils.space_ops",
+    "regular_vertices": ".utils.space_ops",
+    "complex_to_R3": ".utils.space_ops",
+    "R3_to_complex": ".utils.space_ops",
+    "complex_func_to_R3_func": ".utils.space_ops",
+    "center_of_mass": ".utils.space_ops",
+    "midpoint": ".utils.space_ops",
+    "find_intersection": ".utils.space_ops",
+    "line_intersection": ".utils.space_ops",
+    "get_winding_number": ".utils.space_ops",
+    "shoelace": ".utils.space_ops",
+    "shoelace_direction": ".utils.space_ops",
+    "cross2d": ".utils.space_ops",
+    "earclip_triangulation": ".utils.space_ops",
+    "cartesian_to_spherical": ".utils.space_ops",
+    "spherical_to_cartesian": ".utils.space_ops",
+    "perpendicular_bisector": ".utils.space_ops",
+    # .utils.tex
+    "TexTemplate": ".utils.tex",
+    # .utils.tex_templates
+    "TexTemplateLibrary": ".utils.tex_templates",
+    "TexFontTemplates": ".utils.tex_templates",
+}
+_LAZY_SUBPACKAGES = ("camera", "mobject", "renderer", "scene")
+
+_LAZY_MODULES = tuple(dict.fromkeys(_LAZY.values()))
+_EAGER = [name for name in globals() if not name.startswith("_")]
+
+
+def _build_all() -> list[str]:
+    # ``from manim import *`` reads __all__ and so loads every module anyway,
+    # which makes it the place to catch names missing from _LAZY
+    from importlib import import_module
+
+    missing = [
+        name
+        for module_name in _LAZY_MODULES
+        for name in import_module(module_name, __name__).__all__
+        if name not in _LAZY
+    ]
+    if missing:
+        raise ImportError(f"manim._LAZY is missing exported names: {missing}")
+    return [*_EAGER, *_LAZY, *_LAZY_SUBPACKAGES]
+
+
+def __getattr__(name: str):
+    from importlib import import_module
+
+    if name == "__all__":
+        value = _build_all()
+    elif name in _LAZY_SUBPACKAGES:
+        return import_module(f".{name}", __name__)
+    elif name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY, *_LAZY_SUBPACKAGES})
@@ -26,6 +26,26 @@ FRAME_HEIGHT = 800
 
 
 class ManimConfig:
+    # the settings read while rendering get fixed slots; __dict__ stays so scripts
+    # can still set other keys (e.g. ``config.frame_size``)
+    __slots__ = (
+        "frame_height",
+        "frame_width",
+        "pixel_width",
+        "pixel_height",
+        "frame_x_radius",
+        "frame_y_radius",
+        "background_color",
+        "background_opacity",
+        "renderer",
+        "dry_run",
+        "input_file",
+        "output_file",
+        "media_dir",
+        "save_sections",
+        "__dict__",
+    )
+
     def __init__(self):
         self.frame_height = FRAME_HEIGHT
         self.frame_width = FRAME_WIDTH
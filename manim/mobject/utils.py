@@ -15,26 +15,35 @@ from .types.point_cloud_mobject import PMobject
 from .types.vectorized_mobject import VMobject
 
 
+# the class to use for each renderer, looked up on every call since
+# ``config.renderer`` can still be changed at runtime
+_MOBJECT_CLASSES = {RendererType.CAIRO: Mobject}
+_VECTORIZED_MOBJECT_CLASSES = {RendererType.CAIRO: VMobject}
+_POINT_MOBJECT_CLASSES = {RendererType.CAIRO: PMobject}
+
+
 def get_mobject_class() -> type:
-    if config.renderer == RendererType.CAIRO:
-        return Mobject
-    raise NotImplementedError(
-        "Base mobjects are not implemented for the active renderer."
-    )
+    mobject_class = _MOBJECT_CLASSES.get(config.renderer)
+    if mobject_class is None:
+        raise NotImplementedError(
+            "Base mobjects are not implemented for the active renderer."
+        )
+    return mobject_class
 
 
 def get_vectorized_mobject_class() -> type:
-    if config.renderer == RendererType.CAIRO:
-        return VMobject
-    raise NotImplementedError(
-        "Vectorized mobjects are not implemented for the active renderer."
-    )
+    mobject_class = _VECTORIZED_MOBJECT_CLASSES.get(config.renderer)
+    if mobject_class is None:
+        raise NotImplementedError(
+            "Vectorized mobjects are not implemented for the active renderer."
+        )
+    return mobject_class
 
 
 def get_point_mobject_class() -> type:
-
-    if config.renderer == RendererType.CAIRO:
-        return PMobject
-    raise NotImplementedError(
-        "Point cloud mobjects are not implemented for the active renderer."
-    )
+    mobject_class = _POINT_MOBJECT_CLASSES.get(config.renderer)
+    if mobject_class is None:
+        raise NotImplementedError(
+            "Point cloud mobjects are not implemented for the active renderer."
+        )
+    return mobject_class
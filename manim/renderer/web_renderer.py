@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import typing
 
 import numpy as np
@@ -7,7 +8,8 @@ import numpy as np
 
 from ..camera.camera import Camera
 from ..mobject.mobject import Mobject
-from ..utils.iterables import list_update
+from ..utils.family import extract_mobject_family_members
+from ..utils.iterables import list_update_by_id
 
 if typing.TYPE_CHECKING:
 
@@ -31,6 +33,13 @@ class WebRenderer:
         camera_cls = camera_class if camera_class is not None else Camera
         self.camera = camera_cls()
         self.static_image = None
+        # fingerprint of the last frame cached by update_frame, its pixels and
+        # the static image and camera background it was drawn on (kept so that
+        # their ids stay unique)
+        self._last_frame_signature = None
+        self._last_pixels = None
+        self._last_static_image = None
+        self._last_background = None
 
     def init_scene(self, scene):
         # web-manim
@@ -42,6 +51,7 @@ class WebRenderer:
         mobjects: typing.Iterable[Mobject] | None = None,
         include_submobjects: bool = True,
         ignore_skipping: bool = True,
+        cache_frame: bool = False,
         **kwargs,
     ):
         """Update the frame.
@@ -57,21 +67,73 @@ class WebRenderer:
 
         ignore_skipping
 
+        cache_frame
+            Whether to keep the drawn pixels so an identical frame can be
+            reused without redrawing. Only worth it where the same frame is
+            likely to be requested again.
+
         **kwargs
 
         """
         if not mobjects:
-            mobjects = list_update(
-                scene.mobjects,
-                scene.foreground_mobjects,
-            )
+            mobjects = list_update_by_id(scene.mobjects, scene.foreground_mobjects)
+        kwargs["include_submobjects"] = include_submobjects
+        if cache_frame:
+            signature = self.get_frame_signature(mobjects, **kwargs)
+            if signature == self._last_frame_signature:
+                self.camera.set_pixel_array(self._last_pixels)
+                return
+
         if self.static_image is not None:
             self.camera.set_frame_to_background(self.static_image)
         else:
             self.camera.reset()
 
-        kwargs["include_submobjects"] = include_submobjects
         self.camera.capture_mobjects(mobjects, **kwargs)
+        if cache_frame:
+            self._last_frame_signature = signature
+            self._last_pixels = self.camera.pixel_array.copy()
+            self._last_static_image = self.static_image
+            self._last_background = self.camera.background
+
+    def get_frame_signature(self, mobjects: typing.Iterable[Mobject], **kwargs):
+        """Fingerprint everything that decides what :meth:`update_frame` draws.
+
+        Mobjects are edited in place between frames, so their ids alone are not
+        enough: the digest also covers every array and scalar attribute of each
+        family member (points, colors, widths, ...), the camera's frame, pixel
+        shape and background, and the static background image. Both images
+        are only ever replaced, never edited in place, so their ids stand in
+        for their pixels.
+
+        Returns
+        -------
+        bytes
+            A digest of the drawing inputs above; equal digests mean the last
+            cached frame can be reused.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(sorted(kwargs.items())).encode())
+        digest.update(repr(id(self.static_image)).encode())
+        digest.update(repr(id(self.camera.background)).encode())
+        digest.update(
+            repr((self.camera.pixel_height, self.camera.pixel_width)).encode()
+        )
+        for value in (
+            self.camera.frame_center,
+            self.camera.frame_width,
+            self.camera.frame_height,
+        ):
+            digest.update(np.asarray(value, dtype=float).tobytes())
+        for mob in extract_mobject_family_members(mobjects):
+            digest.update(repr(id(mob)).encode())
+            for key, value in vars(mob).items():
+                if isinstance(value, np.ndarray):
+                    digest.update(key.encode())
+                    digest.update(value.tobytes())
+                elif isinstance(value, (int, float, str)):
+                    digest.update(f"{key}={value!r}".encode())
+        return digest.digest()
 
     def render(self, scene, time, moving_mobjects):
         self.update_frame(scene, moving_mobjects)
@@ -94,7 +156,7 @@ class WebRenderer:
         Opens the current frame in the Default Image Viewer
         of your system.
         """
-        self.update_frame(scene, ignore_skipping=True)
+        self.update_frame(scene, ignore_skipping=True, cache_frame=True)
         self.camera.get_image().show()
 
     def save_static_frame_data(
@@ -74,7 +74,7 @@ __all__ = ["MovingCameraScene"]
 from ..camera.moving_camera import MovingCamera
 from ..scene.scene import Scene
 from ..utils.family import extract_mobject_family_members
-from ..utils.iterables import list_update
+from ..utils.iterables import list_update_by_id
 
 
 class MovingCameraScene(Scene):
@@ -107,5 +107,5 @@ class MovingCameraScene(Scene):
             if movement_indicator in all_moving_mobjects:
                 # When one of these is moving, the camera should
                 # consider all mobjects to be moving
-                return list_update(self.mobjects, moving_mobjects)
+                return list_update_by_id(self.mobjects, moving_mobjects)
         return moving_mobjects
@@ -8,17 +8,15 @@ from manim.utils.file_ops import open_file
 __all__ = ["Scene"]
 
 import copy
-import inspect
 import random
 import types
-from queue import Queue
+from collections import Counter, deque
 
 
 from manim.scene.section import DefaultSectionType
 
 from typing import TYPE_CHECKING
 
-import numpy as np
 from watchdog.events import FileSystemEventHandler
 
 from manim.mobject.mobject import Mobject
@@ -29,7 +27,7 @@ from ..constants import *
 from ..renderer.web_renderer import WebRenderer
 from ..utils.exceptions import EndSceneEarlyException, RerunSceneException
 from ..utils.family import extract_mobject_family_members
-from ..utils.iterables import list_difference_update, list_update
+from ..utils.iterables import list_difference_update_by_id, list_update_by_id
 
 if TYPE_CHECKING:
     pass
@@ -43,7 +41,8 @@ class RerunSceneHandler(FileSystemEventHandler):
         self.queue = queue
 
     def on_modified(self, event):
-        self.queue.put(("rerun_file", [], {}))
+        # deque.append is atomic, so the watchdog thread needs no lock here.
+        self.queue.append(("rerun_file", [], {}))
 
 
 class Scene:
@@ -77,6 +76,38 @@ class Scene:
 
     """
 
+    # the attributes set in __init__ get fixed slots; __dict__ stays so user
+    # scenes can still store their own state on self
+    __slots__ = (
+        "camera_class",
+        "always_update_mobjects",
+        "random_seed",
+        "skip_animations",
+        "animations",
+        "stop_condition",
+        "moving_mobjects",
+        "static_mobjects",
+        "time_progression",
+        "duration",
+        "last_t",
+        "queue",
+        "skip_animation_preview",
+        "meshes",
+        "camera_target",
+        "widgets",
+        "updaters",
+        "point_lights",
+        "ambient_light",
+        "key_to_function_map",
+        "mouse_press_callbacks",
+        "interactive_mode",
+        "renderer",
+        "mobjects",
+        "foreground_mobjects",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         renderer=None,
@@ -97,7 +128,7 @@ class Scene:
         self.time_progression = None
         self.duration = None
         self.last_t = None
-        self.queue = Queue()
+        self.queue = deque()
         self.skip_animation_preview = False
         self.meshes = []
         self.camera_target = ORIGIN
@@ -122,6 +153,8 @@ class Scene:
         # TODO, remove need for foreground mobjects
         self.foreground_mobjects = []
         if self.random_seed is not None:
+            import numpy as np
+
             random.seed(self.random_seed)
             np.random.seed(self.random_seed)
 
@@ -133,7 +166,13 @@ class Scene:
         cls = self.__class__
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
-        for k, v in self.__dict__.items():
+        attributes = {
+            k: getattr(self, k)
+            for k in Scene.__slots__
+            if not k.startswith("__") and hasattr(self, k)
+        }
+        attributes.update(self.__dict__)
+        for k, v in attributes.items():
             if k in ["renderer", "time_progression"]:
                 continue
             if k == "camera_class":
@@ -143,6 +182,8 @@ class Scene:
 
         # Update updaters
         for mobject in self.mobjects:
+            if not mobject.updaters:
+                continue
             cloned_updaters = []
             for updater in mobject.updaters:
                 # Make the cloned updater use the cloned Mobjects as free variables
@@ -150,7 +191,14 @@ class Scene:
                 # dis module will help in understanding this.
                 # https://docs.python.org/3/library/dis.html
                 # TODO: Do the same for function calls recursively.
-                free_variable_map = inspect.getclosurevars(updater).nonlocals
+                # Read the closure cells directly; inspect.getclosurevars would
+                # also disassemble the code to resolve globals we don't need.
+                free_variable_map = {
+                    name: cell.cell_contents
+                    for name, cell in zip(
+                        updater.__code__.co_freevars, updater.__closure__ or ()
+                    )
+                }
                 cloned_co_freevars = []
                 cloned_closure = []
                 for free_variable_name in updater.__code__.co_freevars:
@@ -303,13 +351,15 @@ class Scene:
         """
         # Return only those which are not in the family
         # of another mobject from the scene
-        families = [m.get_family() for m in self.mobjects]
-
-        def is_top_level(mobject):
-            num_families = sum((mobject in family) for family in families)
-            return num_families == 1
-
-        return list(filter(is_top_level, self.mobjects))
+        family_ids = {}
+        num_families = Counter(
+            member_id
+            for mob in self.mobjects
+            for member_id in (
+                self._get_family_ids(mob, family_ids) if mob.submobjects else (id(mob),)
+            )
+        )
+        return [mob for mob in self.mobjects if num_families[id(mob)] == 1]
 
     def get_mobject_family_members(self):
         """
@@ -330,6 +380,27 @@ class Scene:
                 use_z_index=self.renderer.camera.use_z_index,
             )
 
+    def _get_family_ids(self, mobject: Mobject, family_ids: dict) -> set[int]:
+        # Ids of mobject.get_family(), memoized in family_ids for the length of
+        # one call so shared subtrees are walked only once. Children are filled
+        # in before their parents with an explicit stack, so deep trees don't
+        # hit the recursion limit.
+        stack = [(mobject, False)]
+        while stack:
+            mob, children_done = stack.pop()
+            key = id(mob)
+            if key in family_ids:
+                continue
+            if children_done:
+                ids = {key}
+                for submob in mob.submobjects:
+                    ids |= family_ids[id(submob)]
+                family_ids[key] = ids
+            else:
+                stack.append((mob, True))
+                stack.extend((submob, False) for submob in mob.submobjects)
+        return family_ids[id(mobject)]
+
     def add(self, *mobjects: Mobject):
         """
         Mobjects will be displayed, from background to
@@ -348,12 +419,18 @@ class Scene:
         """
         if config.renderer == RendererType.CAIRO:
             mobjects = [*mobjects, *self.foreground_mobjects]
-            self.restructure_mobjects(to_remove=mobjects)
+            # Expand the families once for both lists
+            to_remove = extract_mobject_family_members(
+                mobjects,
+                use_z_index=self.renderer.camera.use_z_index,
+            )
+            self.restructure_mobjects(to_remove, extract_families=False)
             self.mobjects += mobjects
             if self.moving_mobjects:
                 self.restructure_mobjects(
-                    to_remove=mobjects,
+                    to_remove,
                     mobject_list_name="moving_mobjects",
+                    extract_families=False,
                 )
                 self.moving_mobjects += mobjects
         return self
@@ -409,17 +486,19 @@ class Scene:
         ) -> bool:
             # We use breadth-first search because some Mobjects get very deep and
             # we expect top-level elements to be the most common targets for replace.
-            for i in range(0, len(mobj_list)):
-                # Is this the old mobject?
-                if mobj_list[i] == old_m:
-                    # If so, write the new object to the same spot and stop looking.
-                    mobj_list[i] = new_m
-                    return True
-            # Now check all the children of all these mobs.
-            for mob in mobj_list:  # noqa: SIM110
-                if replace_in_list(mob.submobjects, old_m, new_m):
-                    # If we found it in a submobject, stop looking.
-                    return True
+            lists_to_check = deque([mobj_list])
+            while lists_to_check:
+                current_list = lists_to_check.popleft()
+                for i, mob in enumerate(current_list):
+                    # Is this the old mobject?
+                    if mob is old_m:
+                        # If so, write the new object to the same spot and stop looking.
+                        current_list[i] = new_m
+                        return True
+                # Queue the children of these mobs behind the rest of this level.
+                for mob in current_list:
+                    if mob.submobjects:
+                        lists_to_check.append(mob.submobjects)
             # If we did not find the mobject in the mobject list or any submobjects,
             # (or the list was empty), indicate we did not make the replacement.
             return False
@@ -472,11 +551,67 @@ class Scene:
                 use_z_index=self.renderer.camera.use_z_index,
             )
         _list = getattr(self, mobject_list_name)
-        new_list = self.get_restructured_mobject_list(_list, to_remove)
+        ids_to_remove = {id(mob) for mob in to_remove}
+        owners = self.get_family_owner_index(_list)
+        present_ids = [key for key in ids_to_remove if key in owners]
+        if not present_ids:
+            # Nothing to take out, so keep the list rather than copying it
+            return self
+        # When everything being removed sits in exactly one entry's family and
+        # that entry is itself removed, no group has to be dissolved.
+        if all(
+            owners[key] is not None and id(_list[owners[key]]) in ids_to_remove
+            for key in present_ids
+        ):
+            new_list = [mob for mob in _list if id(mob) not in ids_to_remove]
+        else:
+            new_list = self.get_restructured_mobject_list(
+                _list, to_remove, to_remove_ids=ids_to_remove
+            )
         setattr(self, mobject_list_name, new_list)
         return self
 
-    def get_restructured_mobject_list(self, mobjects: list, to_remove: list):
+    def get_family_owner_index(self, mobjects: list) -> dict[int, int | None]:
+        """
+        Maps the id of every family member of the given mobjects to the index
+        of the mobject whose family contains it, or to ``None`` if it belongs to
+        the families of several of them.
+
+        Parameters
+        ----------
+        mobjects
+            The Mobjects to index.
+
+        Returns
+        -------
+        dict
+            The index of family members by id.
+        """
+        owners = {}
+        for i, mob in enumerate(mobjects):
+            if not mob.submobjects:
+                key = id(mob)
+                owners[key] = None if key in owners else i
+                continue
+            visited = set()
+            stack = [mob]
+            while stack:
+                member = stack.pop()
+                key = id(member)
+                if key in visited:
+                    continue
+                visited.add(key)
+                owners[key] = None if key in owners else i
+                stack.extend(member.submobjects)
+        return owners
+
+    def get_restructured_mobject_list(
+        self,
+        mobjects: list,
+        to_remove: list,
+        *,
+        to_remove_ids: set[int] | None = None,
+    ):
         """
         Given a list of mobjects and a list of mobjects to be removed, this
         filters out the removable mobjects from the list of mobjects.
@@ -490,25 +625,38 @@ class Scene:
         to_remove
             The list of mobjects to remove.
 
+        to_remove_ids
+            The ids of ``to_remove``, if the caller already has them.
+
         Returns
         -------
         list
             The list of mobjects with the mobjects to remove removed.
         """
+        if to_remove_ids is None:
+            to_remove_ids = {id(mob) for mob in to_remove}
 
         new_mobjects = []
-
-        def add_safe_mobjects_from_list(list_to_examine, set_to_remove):
+        family_ids = {}
+        # Each entry is a partly consumed list with the ids still to be removed
+        # beneath it, so mobjects come out in the same order as a recursive walk.
+        stack = [(iter(mobjects), to_remove_ids)]
+        while stack:
+            list_to_examine, ids_to_remove = stack[-1]
             for mob in list_to_examine:
-                if mob in set_to_remove:
+                if id(mob) in ids_to_remove:
                     continue
-                intersect = set_to_remove.intersection(mob.get_family())
-                if intersect:
-                    add_safe_mobjects_from_list(mob.submobjects, intersect)
-                else:
-                    new_mobjects.append(mob)
-
-        add_safe_mobjects_from_list(mobjects, set(to_remove))
+                # A leaf's family is just itself, which was checked above.
+                if mob.submobjects:
+                    intersect = ids_to_remove.intersection(
+                        self._get_family_ids(mob, family_ids)
+                    )
+                    if intersect:
+                        stack.append((iter(mob.submobjects), intersect))
+                        break
+                new_mobjects.append(mob)
+            else:
+                stack.pop()
         return new_mobjects
 
     # TODO, remove this, and calls to this
@@ -527,7 +675,7 @@ class Scene:
         Scene
             The Scene, with the foreground mobjects added.
         """
-        self.foreground_mobjects = list_update(self.foreground_mobjects, mobjects)
+        self.foreground_mobjects = list_update_by_id(self.foreground_mobjects, mobjects)
         self.add(*mobjects)
         return self
 
@@ -657,20 +805,31 @@ class Scene:
         # as soon as there's one that needs updating of
         # some kind per frame, return the list from that
         # point forward.
-        animation_mobjects = [anim.mobject for anim in animations]
+        animation_mobject_ids = {id(anim.mobject) for anim in animations}
+        foreground_ids = {id(mob) for mob in self.foreground_mobjects}
         mobjects = self.get_mobject_family_members()
+        # Every family member of a scene mobject is in this list too, so a
+        # family has updaters exactly when it shares a member with this set.
+        updating_ids = {id(mob) for mob in mobjects if mob.updaters}
+        family_ids = {}
         for i, mob in enumerate(mobjects):
-            update_possibilities = [
-                mob in animation_mobjects,
-                len(mob.get_family_updaters()) > 0,
-                mob in self.foreground_mobjects,
-            ]
-            if any(update_possibilities):
+            if (
+                mob.updaters
+                or id(mob) in animation_mobject_ids
+                or id(mob) in foreground_ids
+                or (
+                    updating_ids
+                    and mob.submobjects
+                    and not updating_ids.isdisjoint(
+                        self._get_family_ids(mob, family_ids)
+                    )
+                )
+            ):
                 return mobjects[i:]
         return []
 
     def get_moving_and_static_mobjects(self, animations):
-        all_mobjects = list_update(self.mobjects, self.foreground_mobjects)
+        all_mobjects = list_update_by_id(self.mobjects, self.foreground_mobjects)
         all_mobject_families = extract_mobject_family_members(
             all_mobjects,
             use_z_index=self.renderer.camera.use_z_index,
@@ -681,7 +840,7 @@ class Scene:
             moving_mobjects,
             use_z_index=self.renderer.camera.use_z_index,
         )
-        static_mobjects = list_difference_update(
+        static_mobjects = list_difference_update_by_id(
             all_mobject_families,
             all_moving_mobject_families,
         )
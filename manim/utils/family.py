@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import itertools as it
 from typing import Iterable
 
 from ..mobject.mobject import Mobject
@@ -31,13 +30,18 @@ def extract_mobject_family_members(
     list
         list of the mobjects and family members.
     """
+    # One pre-order walk over every tree, then a single pass dropping repeats,
+    # gives the same order as deduplicating each get_family() and their chain.
+    extracted_mobjects = []
+    stack = list(mobjects)[::-1]
+    while stack:
+        mob = stack.pop()
+        extracted_mobjects.append(mob)
+        if mob.submobjects:
+            stack.extend(reversed(mob.submobjects))
+    extracted_mobjects = remove_list_redundancies(extracted_mobjects)
     if only_those_with_points:
-        method = Mobject.family_members_with_points
-    else:
-        method = Mobject.get_family
-    extracted_mobjects = remove_list_redundancies(
-        list(it.chain(*(method(m) for m in mobjects))),
-    )
+        extracted_mobjects = [m for m in extracted_mobjects if m.get_num_points() > 0]
     if use_z_index:
         return sorted(extracted_mobjects, key=lambda m: m.z_index)
     return extracted_mobjects
@@ -4,23 +4,53 @@ import subprocess as sp
 from pathlib import Path
 
 
+def _spawn_viewer(commands):
+    # Detach the viewer from our stdio and session; close_fds=False skips the
+    # loop that closes every inherited file descriptor in the child.
+    sp.Popen(
+        commands,
+        stdin=sp.DEVNULL,
+        stdout=sp.DEVNULL,
+        stderr=sp.DEVNULL,
+        close_fds=False,
+        start_new_session=True,
+    )
+
+
+def _open_windows(file_path, in_browser):
+    os.startfile(file_path if not in_browser else file_path.parent)
+
+
+def _open_linux(file_path, in_browser):
+    _spawn_viewer(["xdg-open", file_path if not in_browser else file_path.parent])
+
+
+def _open_cygwin(file_path, in_browser):
+    _spawn_viewer(["cygstart", file_path if not in_browser else file_path.parent])
+
+
+def _open_darwin(file_path, in_browser):
+    commands = ["open"] if not in_browser else ["open", "-R"]
+    _spawn_viewer([*commands, file_path])
+
+
+_CURRENT_OS = platform.system()
+_FILE_OPENERS = {
+    "Windows": _open_windows,
+    "Linux": _open_linux,
+    "CYGWIN": _open_cygwin,
+    "Darwin": _open_darwin,
+}
+# Cygwin reports its version in the system name, e.g. "CYGWIN_NT-10.0".
+_OPEN_FILE = _FILE_OPENERS.get(
+    "CYGWIN" if _CURRENT_OS.startswith("CYGWIN") else _CURRENT_OS
+)
+
+
 def open_file(file_path, in_browser=False):
-    current_os = platform.system()
-    if current_os == "Windows":
-        os.startfile(file_path if not in_browser else file_path.parent)
-    else:
-        if current_os == "Linux":
-            commands = ["xdg-open"]
-            file_path = file_path if not in_browser else file_path.parent
-        elif current_os.startswith("CYGWIN"):
-            commands = ["cygstart"]
-            file_path = file_path if not in_browser else file_path.parent
-        elif current_os == "Darwin":
-            commands = ["open"] if not in_browser else ["open", "-R"]
-        else:
-            raise OSError("Unable to identify your operating system...")
-        commands.append(file_path)
-        sp.Popen(commands)
+    if _OPEN_FILE is None:
+        raise OSError("Unable to identify your operating system...")
+    _OPEN_FILE(file_path, in_browser)
 
 
 def add_extension_if_not_present(file_name: Path, extension: str) -> Path:
@@ -31,6 +61,5 @@ def add_extension_if_not_present(file_name: Path, extension: str) -> Path:
 
 
 def guarantee_existence(path: Path) -> Path:
-    if not path.exists():
-        path.mkdir(parents=True)
-    return path.resolve(strict=True)
+    os.makedirs(path, exist_ok=True)
+    return Path(os.path.realpath(path))
@@ -8,7 +8,9 @@ __all__ = [
     "all_elements_are_instances",
     "concatenate_lists",
     "list_difference_update",
+    "list_difference_update_by_id",
     "list_update",
+    "list_update_by_id",
     "listify",
     "make_even",
     "make_even_by_cycling",
@@ -129,6 +131,22 @@ def list_difference_update(l1: Iterable, l2: Iterable) -> list:
     return [e for e in l1 if e not in l2]
 
 
+def list_difference_update_by_id(l1: Iterable, l2: Iterable) -> list:
+    """Like :func:`list_difference_update`, but compares elements by identity,
+    with one set lookup per element instead of a scan of l2.
+
+    Examples
+    --------
+    Normal usage::
+
+        a, b, c = object(), object(), object()
+        list_difference_update_by_id([a, b, c], [b])
+        # returns [a, c]
+    """
+    ids = {id(e) for e in l2}
+    return [e for e in l1 if id(e) not in ids]
+
+
 def list_update(l1: Iterable, l2: Iterable) -> list:
     """Used instead of ``set.update()`` to maintain order,
         making sure duplicates are removed from l1, not l2.
@@ -144,6 +162,22 @@ def list_update(l1: Iterable, l2: Iterable) -> list:
     return [e for e in l1 if e not in l2] + list(l2)
 
 
+def list_update_by_id(l1: Iterable, l2: Iterable) -> list:
+    """Like :func:`list_update`, but compares elements by identity,
+    with one set lookup per element instead of a scan of l2.
+
+    Examples
+    --------
+    Normal usage::
+
+        a, b, c = object(), object(), object()
+        list_update_by_id([a, b, c], [b, a])
+        # returns [c, b, a]
+    """
+    l2 = list(l2)
+    return list_difference_update_by_id(l1, l2) + l2
+
+
 def listify(obj) -> list:
     """Converts obj to a list intelligently.
 